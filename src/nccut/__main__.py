@@ -1,10 +1,10 @@
-import re
 import argparse
 import os
 from progress.bar import ChargingBar
 bar = ChargingBar("Loading App", max=3)
 bar.next()
 from nccut.nccut import NcCut
+import nccut.functions as func
 bar.next()
 
 
@@ -22,17 +22,17 @@ def run():
         if not os.path.isfile(file):
             print("ERROR: File Not Found")
             return
-        elif len(re.findall(r'[^A-Za-z0-9_:\\.\-/]', str(file))) > 0:
+        elif not func.VALID_PATH_CHARS.issuperset(str(file)):
             print("ERROR: Invalid File Name")
             return
-        elif not os.path.splitext(file)[1] in [".jpg", ".jpeg", ".png", ".nc"]:
+        elif os.path.splitext(file)[1] not in func.FILE_TYPES:
             print("ERROR: File not an Image or NetCDF File")
             return
     if config:
         if not os.path.isfile(config):
             print("ERROR: Config File Not Found")
             return
-        elif len(re.findall(r'[^A-Za-z0-9_:\\.\-/]', str(file))) > 0:
+        elif not func.VALID_PATH_CHARS.issuperset(str(config)):
             print("ERROR: Invalid Config File Path")
             return
         elif not os.path.basename(config) == "nccut_config.toml":
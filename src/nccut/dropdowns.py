@@ -12,9 +12,13 @@ Static aspects are in the nccut.kv file.
 
 from kivy.uix.button import Button
 from kivy.uix.dropdown import DropDown
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.properties import ObjectProperty
 from kivy.app import App
 from kivy.metrics import dp
 import nccut.functions as func
+from functools import partial
 import os
 
 
@@ -73,6 +77,33 @@ class CircleSizeDropDown(DropDown):
             self.home.display.update_settings("cir_size", cir_size)
 
 
+class RecycleDropDownButton(Button):
+    """
+    Row button for dropdown lists backed by a RecycleView.
+
+    Only the visible rows exist as widgets. The RecycleView reuses them as the list is scrolled by
+    reassigning their text.
+
+    Attributes:
+        dropdown: kivy.uix.dropdown.DropDown the row belongs to. The row is passed to its select method when pressed.
+    """
+    dropdown = ObjectProperty(None, allownone=True)
+
+    def __init__(self, **kwargs):
+        """
+        Sets text layout so long values are shortened to fit the button.
+        """
+        super(RecycleDropDownButton, self).__init__(halign='center', valign='middle', shorten=True, **kwargs)
+        self.bind(size=func.text_wrap)
+
+    def on_release(self):
+        """
+        Select this row's value in the parent dropdown.
+        """
+        if self.dropdown:
+            self.dropdown.select(self)
+
+
 class NetCDFDropDown(DropDown):
     """
     Dynamic elements of the NetCDF setting menu
@@ -92,7 +123,7 @@ class NetCDFDropDown(DropDown):
         Connects to root HomeScreen instance and defines dropdown menus.
 
         Colormaps are defined in :class:`nccut.filedisplay.FileDisplay` class. Variables and z dimension values come
-        from the currently loaded NetCDF file.
+        from the currently loaded NetCDF file. Each dropdown passes the selected button to its on_select event.
         """
         super(NetCDFDropDown, self).__init__(**kwargs)
         self.home = App.get_running_app().root.get_screen("HomeScreen")
@@ -102,31 +133,61 @@ class NetCDFDropDown(DropDown):
         else:
             f_type = None
 
+        if f_type == "netcdf":
+            # Dataset opened by NetCDFConfig when file was loaded
+            nc = self.home.display.config["netcdf"]
+
+        # Colormap buttons are built the first time the colormap dropdown is opened
         self.cmap_dropdown = DropDown()
-        if self.home.file_on and f_type == "netcdf":
-            for i in self.home.display.cmaps:
-                btn = Button(text=i, size_hint_y=None, height=dp(20) + self.font, font_size=self.font)
-                btn.bind(on_release=lambda btn: self.pass_setting("colormap", btn.text),  # Setting name: 'colormap'
-                         on_press=self.cmap_dropdown.dismiss)
-                self.cmap_dropdown.add_widget(btn)
+        self.cmap_dropdown.bind(on_select=partial(self.select_setting, "colormap"))
 
         self.var_dropdown = DropDown()
+        self.var_dropdown.bind(on_select=partial(self.select_setting, "variable"))
         if self.home.file_on and f_type == "netcdf":
-            for i in list(self.home.display.config["netcdf"]["data"].keys()):
+            for i in nc["data"].data_vars:
                 btn = Button(text=i, size_hint_y=None, height=dp(20) + self.font,
                              halign='center', valign='middle', shorten=True, font_size=self.font)
-                btn.bind(on_press=lambda btn: self.pass_setting("variable", btn.text), size=func.text_wrap,
-                         on_release=self.var_dropdown.dismiss)  # Setting name: 'variable'
+                btn.bind(on_release=self.var_dropdown.select, size=func.text_wrap)
                 self.var_dropdown.add_widget(btn)
 
         self.depth_dropdown = DropDown()
-        if self.home.file_on and f_type == "netcdf" and self.home.display.config['netcdf']['z'] != "N/A":
-            for i in list(self.home.display.config["netcdf"]['data'][self.home.display.config["netcdf"]['z']].data):
-                btn = Button(text=str(i), size_hint_y=None, height=dp(20) + self.font, halign='center', valign='middle',
-                             shorten=True, font_size=self.font)
-                btn.bind(on_press=lambda btn: self.pass_setting("depth", btn.text), size=func.text_wrap,
-                         on_release=self.depth_dropdown.dismiss)  # Setting name: 'depth'
-                self.depth_dropdown.add_widget(btn)
+        self.depth_dropdown.bind(on_select=partial(self.select_setting, "depth"))
+        if self.home.file_on and f_type == "netcdf" and nc['z'] != "N/A":
+            # Z dimensions can have thousands of values so rows are virtualized rather than one Button per value
+            z_vals = nc['data'][nc['z']].data.astype(str).tolist()
+            row_height = dp(20) + self.font
+            rv = RecycleView(size_hint_y=None, height=min(len(z_vals) * row_height, dp(300)), do_scroll_x=False)
+            rv.add_widget(RecycleBoxLayout(orientation='vertical', size_hint_y=None, default_size=(None, row_height),
+                                           default_size_hint=(1, None)))
+            rv.viewclass = RecycleDropDownButton  # Needs the layout manager to already be attached
+            rv.layout_manager.bind(minimum_height=rv.layout_manager.setter('height'))
+            rv.data = [{'text': z, 'font_size': self.font, 'dropdown': self.depth_dropdown} for z in z_vals]
+            self.depth_dropdown.add_widget(rv)
+
+    def open_cmap_dropdown(self, widget):
+        """
+        Opens the colormap dropdown, adding a button for each colormap the first time it is opened.
+
+        Args:
+            widget: Button to attach the dropdown to
+        """
+        if not self.cmap_dropdown.container.children and self.home.file_on and self.home.display.f_type == "netcdf":
+            for i in self.home.display.cmaps:
+                btn = Button(text=i, size_hint_y=None, height=dp(20) + self.font, font_size=self.font)
+                btn.bind(on_release=self.cmap_dropdown.select)
+                self.cmap_dropdown.add_widget(btn)
+        self.cmap_dropdown.open(widget)
+
+    def select_setting(self, setting, dropdown, btn):
+        """
+        Passes the text of a button selected from one of the setting dropdowns to the display.
+
+        Args:
+            setting (str): Name of setting being changed: 'colormap', 'variable', or 'depth'
+            dropdown: kivy.uix.dropdown.DropDown the button was selected from
+            btn: Selected button
+        """
+        self.pass_setting(setting, btn.text)
 
     def pass_setting(self, setting, value):
         """
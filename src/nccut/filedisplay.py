@@ -21,19 +21,15 @@ from kivy.core.window import Window
 import kivy.uix as ui
 from kivy.uix.label import Label
 from kivy.core.image import Image as CoreImage
+from kivy.graphics.texture import Texture
 from kivy.metrics import dp
-from PIL import Image as im
-from PIL import ImageEnhance
 import platform
 import subprocess
 from plyer import filechooser
 import numpy as np
-from scipy.interpolate import RegularGridInterpolator
 import matplotlib.pyplot as plt
-import io
 import os
 import pathlib
-import re
 import copy
 import warnings
 import nccut.functions as func
@@ -60,11 +56,21 @@ class FileDisplay(ScatterLayout):
         pos (tuple): Position of viewer. Used to properly place transect widgets on screen.
         sidebar (list): Reference to list of sidebar buttons
         og_sidebar (list): Original state of sidebar before any tools added widgets
-        im: kivy.core.CoreImage made from data array
-        byte: io.BytesIO object containing image made from NetCDF dataset loaded in memory
+        im: If file is an image, kivy.core.CoreImage made from the image file
+        nc_texture: If file is a NetCDF file, kivy.graphics.texture.Texture made from NetCDF dataset
         img: kivy.uix.image.Image UI element which displays the image over the scatter object
         tool: Reference to currently loaded tool
         nc_data: If file is a NetCDF file, actively loaded data array
+        nc_range: If file is a NetCDF file, array of the minimum and maximum of the actively loaded data array
+        n_data: If file is a NetCDF file, actively loaded data array normalized from 0 to 1
+        cmap_indices (tuple): If file is a NetCDF file, number of colors in the colormap and the colormap index of
+            each pixel of the normalized data for colormaps with that many colors
+        nc_pixels: If file is a NetCDF file, uint8 array of RGBA pixels of the current image
+        colorbar: If file is a NetCDF file, kivy.uix.image.Image of the current colorbar
+        colorbar_key (tuple): If file is a NetCDF file, colormap, data minimum, data maximum, and font size the current
+            colorbar was drawn with
+        var_data (dict): If file is a NetCDF file, variables which have been displayed keyed by name. Each is renamed
+            to have 'x', 'y', and 'z' dimensions and transposed so it only needs to be done once per variable.
         dragging (bool): Whether in dragging mode or not
         editing (bool): Whether in editing mode or not
         t_mode (bool): Whether a tool is currently loaded
@@ -78,7 +84,7 @@ class FileDisplay(ScatterLayout):
         contrast (int): Int from -127 to 127, contrast value to use when making image from NetCDF file
         l_col (str): Line color for transect tools: 'Blue', 'Green' or 'Orange'
         cir_size (float): Circle size for transect tools
-        cmaps (dict): Dictionary of colormap names mapping to colormap values from cv2
+        cmaps (tuple): Names of colormaps available for NetCDF files
         colormap: current colormap data
         btn_height: Height for buttons in sidebar which adapts to font size
         tools_lbl: "Tools" sidebar label
@@ -103,6 +109,8 @@ class FileDisplay(ScatterLayout):
         delete_point_btn: Delete point button
         edit_widgets (list): List of widgets that must be added to screen when entering editing mode
     """
+    cmaps = func.COLORMAPS
+
     def __init__(self, home, f_config, g_config, t_config, **kwargs):
         """
         Initializes settings and defines editing mode buttons.
@@ -121,15 +129,22 @@ class FileDisplay(ScatterLayout):
 
         self.config = f_config
         self.default_orthogonal_width = t_config["orthogonal_width"]
-        self.f_type = list(f_config.keys())[0]
+        self.f_type = next(iter(f_config))
         self.home = home
         self.sidebar = self.home.ids.sidebar
 
         self.im = None
-        self.byte = None
+        self.nc_texture = None
         self.img = None
         self.tool = None
         self.nc_data = None
+        self.nc_range = None
+        self.n_data = None
+        self.colorbar = None
+        self.colorbar_key = None
+        self.cmap_indices = None
+        self.nc_pixels = None
+        self.var_data = {}
 
         self.dragging = False
         self.editing = False
@@ -149,7 +164,6 @@ class FileDisplay(ScatterLayout):
         self.l_col = g_config["line_color"]
         self.cir_size = g_config["circle_size"]
 
-        self.cmaps = plt.colormaps()[:87]
         self.colormap = g_config["colormap"]
         self.btn_height = dp(20) + self.home.font
         # Initial Sidebar Widgets
@@ -242,9 +256,9 @@ class FileDisplay(ScatterLayout):
         # Re-centers and rescales image on viewer resize
         self.x_axis()
         self.y_axis()
-        if self.f_type == "netcdf":
-            self.home.update_colorbar(func.get_color_bar(self.colormap, self.nc_data, (0.1, 0.1, 0.1),
-                                                         "white", font * 2.5))
+        # Color bar only needs to be replaced if its font size changed since it was last drawn
+        if self.f_type == "netcdf" and font != self.colorbar_key[-1]:
+            self.home.update_colorbar(self.get_colorbar(font))
         if self.t_mode:
             self.tool.font_adapt(font)
 
@@ -254,13 +268,13 @@ class FileDisplay(ScatterLayout):
         """
         if self.f_type == "netcdf":
             self.netcdf_to_image()
-            self.byte.seek(0)
-            self.im = CoreImage(self.byte, ext='png')
-            self.size = self.im.size
+            texture = self.nc_texture
+            self.size = texture.size
         elif self.f_type == "image":
             self.im = CoreImage(self.config[self.f_type])
-            self.size = im.open(self.config[self.f_type]).size
-        self.img = ui.image.Image(source="", texture=self.im.texture, size=self.size, pos=self.pos)
+            texture = self.im.texture
+            self.size = self.im.size
+        self.img = ui.image.Image(source="", texture=texture, size=self.size, pos=self.pos)
         self.home.ids.view.bind(size=self.resize_to_fit)
         self.add_widget(self.img)
         self.home.populate_dynamic_sidebar(self.initial_side_bar)
@@ -332,7 +346,7 @@ class FileDisplay(ScatterLayout):
         path = self.home.rel_path
         if text.find(".") >= 1:
             text = text[:text.find(".")]
-        if text == "" or len(re.findall(r'[^A-Za-z0-9_\-/:\\]', text)) > 0:
+        if text == "" or not func.VALID_NAME_CHARS.issuperset(text):
             func.alert_popup("Invalid file name")
             return False
         if "/" in text:
@@ -457,55 +471,66 @@ class FileDisplay(ScatterLayout):
             self.cir_size = float(value)
             if self.t_mode:
                 self.tool.update_c_size(float(value))
+        # NetCDF image is only reloaded if the setting actually changed
         elif setting == "contrast":
-            if self.f_type == "netcdf":
+            if self.f_type == "netcdf" and func.contrast_function(value) != self.contrast:
                 self.contrast = func.contrast_function(value)
-                self.update_netcdf()
+                self.update_netcdf(reload=False)
         elif setting == "colormap":
-            if self.f_type == "netcdf":
+            if self.f_type == "netcdf" and value != self.colormap:
                 self.colormap = value
-                self.update_netcdf()
+                self.update_netcdf(reload=False)
         elif setting == "variable":
-            if self.f_type == "netcdf":
+            if self.f_type == "netcdf" and value != self.config['netcdf']['var']:
                 self.config['netcdf']['var'] = value
                 self.update_netcdf()
         elif setting == "depth":
-            if self.f_type == "netcdf" and self.config['netcdf']['z'] != 'N/A':
+            if self.f_type == "netcdf" and self.config['netcdf']['z'] != 'N/A' and value != self.config['netcdf']['z_val']:
                 self.config['netcdf']['z_val'] = value
                 self.update_netcdf()
 
-    def update_netcdf(self):
+    def update_netcdf(self, reload=True):
         """
         Reload netcdf image when netcdf data is changed.
+
+        Args:
+            reload (bool): Whether the selected data changed and must be loaded again. If only the colormap or contrast
+                changed the already normalized data is reused.
         """
-        self.netcdf_to_image()
-        self.byte.seek(0)
-        self.im = CoreImage(self.byte, ext='png')
-        self.size = self.im.size
-        self.img.texture = self.im.texture
-        self.img.reload()
+        if reload:
+            self.netcdf_to_image()
+        else:
+            self.color_image()
+        self.size = self.nc_texture.size
+        self.img.texture = self.nc_texture
+        # Texture may be the same object with new pixels, so the image has to be told to redraw
+        self.img.canvas.ask_update()
 
     def netcdf_to_image(self):
         """
         Creates image from NetCDF dataset defined in :attr:`nccut.filedisplay.FileDisplay.f_config`
 
-        Normalizes data and then applies colormap and contrast settings and then calls for the creation of colorbar.
-        Loads image into memory as io.BytesIO object so kivy can make image out of an array.
+        Interpolates the selected data to an equidistant grid and normalizes it, then has the image made from it by
+        :meth:`nccut.filedisplay.FileDisplay.color_image`.
         """
+        from scipy.interpolate import RegularGridInterpolator
         # Select data
         config = self.config["netcdf"]
-        if config['z'] == 'N/A':
-            # 2D NetCDF data
-            ds = config['data'][config['var']].rename({config['y']: 'y', config['x']: 'x'})
-            data = ds.sel(y=ds['y'], x=ds['x'])
-        else:
-            # 3D NetCDF data
-            ds = config['data'][config['var']].rename({config['y']: 'y', config['x']: 'x', config['z']: 'z'})
-            ds['z'] = ds['z'].astype(str)
-            data = ds.sel(y=ds['y'], x=ds['x'], z=config['z_val'])
+        if config['var'] not in self.var_data:
+            if config['z'] == 'N/A':
+                ds = config['data'][config['var']].rename({config['y']: 'y', config['x']: 'x'}).transpose('y', 'x')
+            else:
+                ds = config['data'][config['var']].rename({config['y']: 'y', config['x']: 'x', config['z']: 'z'})
+                ds = ds.transpose('z', 'y', 'x')
+            self.var_data[config['var']] = ds
+        ds = self.var_data[config['var']]
+        # 2D NetCDF data is used as is
+        data = ds
+        if config['z'] != 'N/A':
+            # 3D NetCDF data. Z value is a string so select it by position rather than converting the z coordinate.
+            data = ds.isel(z=config['z_positions'][config['z_val']])
         x_coord = ds['x'].data
         y_coord = ds['y'].data
-        data = data.transpose('y', 'x')
 
         # Interpolate dataset dimensions to coordinate data
         interp = RegularGridInterpolator((y_coord, x_coord), data.data, method="linear", bounds_error=False,
@@ -517,22 +542,71 @@ class FileDisplay(ScatterLayout):
         xg, yg = np.meshgrid(x, y)
         self.nc_data = np.flip(interp((yg, xg)), 0)
 
-        # Turn into image
+        # Normalize data
         with warnings.catch_warnings(record=True) as w:
-            n_data = (self.nc_data - np.nanmin(self.nc_data)) / (np.nanmax(self.nc_data) - np.nanmin(self.nc_data))
+            self.nc_range = np.array([np.nanmin(self.nc_data), np.nanmax(self.nc_data)])
+            # Kept in double precision so pixels next to the edge of a color bin get the same color as matplotlib
+            # would give them. Only the colormap indices found from it are kept as integers.
+            self.n_data = self.nc_data - self.nc_range[0]
+            self.n_data /= self.nc_range[1] - self.nc_range[0]
             if len(w) > 0 and issubclass(w[-1].category, RuntimeWarning):
                 func.alert_popup("Selected data is all NaN")
-        nans = np.repeat(np.isnan(n_data)[:, :, np.newaxis], 4, axis=2)
-        c_mapped = plt.get_cmap(self.colormap)(n_data)
-        whites = np.ones(c_mapped.shape)
-        self.home.load_colorbar_and_info(func.get_color_bar(self.colormap, self.nc_data, (0.1, 0.1, 0.1), "white",
-                                                            self.home.font * 2.5), self.config[self.f_type])
-        img = np.where(nans, whites, c_mapped)
-        # Applies contrast settings
-        pil_image = im.fromarray(np.uint8(img * 255))
-        img = ImageEnhance.Contrast(pil_image).enhance(self.contrast)
-        self.byte = io.BytesIO()
-        img.save(self.byte, format="PNG")
+        self.cmap_indices = None
+        self.color_image()
+
+    def color_image(self):
+        """
+        Applies colormap and contrast settings to the normalized NetCDF data and then calls for the creation of colorbar.
+
+        Loads image into a kivy texture so it can be displayed.
+        """
+        # Colormap indices only change with the data or the colormap's number of colors so contrast changes and most
+        # colormap changes reuse them
+        n_colors = plt.get_cmap(self.colormap).N
+        if self.cmap_indices is None or self.cmap_indices[0] != n_colors:
+            self.cmap_indices = (n_colors, func.colormap_indices(self.n_data, n_colors))
+        # Pixel buffer is reused between updates as long as the data keeps the same shape
+        if self.nc_pixels is None or self.nc_pixels.shape[:2] != self.n_data.shape:
+            self.nc_pixels = np.empty(self.n_data.shape + (4,), np.uint8)
+        img = func.colormap_image(self.n_data, self.colormap, self.contrast, indices=self.cmap_indices[1],
+                                  out=self.nc_pixels)
+        self.home.load_colorbar_and_info(self.get_colorbar(self.home.font), self.config[self.f_type])
+        # Upload pixels straight to a texture rather than encoding and decoding a PNG. Rows are stored top first like
+        # a decoded image, so texture is flipped to display them the right way up. Texture is reused for as long as
+        # the image keeps the same size.
+        if self.nc_texture is None or self.nc_texture.size != (img.shape[1], img.shape[0]):
+            self.nc_texture = Texture.create(size=(img.shape[1], img.shape[0]), colorfmt='rgba')
+            self.nc_texture.flip_vertical()
+            # A blitted texture has no source Kivy can reload it from if the OpenGL context is lost, so the pixels are
+            # blitted again when that happens
+            self.nc_texture.add_reload_observer(self.reload_texture)
+        self.nc_texture.blit_buffer(img.ravel(), colorfmt='rgba', bufferfmt='ubyte')
+
+    def reload_texture(self, texture):
+        """
+        Blits the current NetCDF pixels into the texture again after Kivy reloads it when the OpenGL context is lost.
+
+        Args:
+            texture: kivy.graphics.texture.Texture being reloaded
+        """
+        texture.blit_buffer(self.nc_pixels.ravel(), colorfmt='rgba', bufferfmt='ubyte')
+
+    def get_colorbar(self, font):
+        """
+        Gets the colorbar for the current colormap and data range, only drawing a new one if either or the font size
+        changed since the last one was drawn.
+
+        Args:
+            font (float): Font size to draw the colorbar with
+
+        Returns:
+            kivy.uix.image.Image object containing image of colorbar
+        """
+        key = (self.colormap, self.nc_range[0], self.nc_range[1], font)
+        if key != self.colorbar_key:
+            self.colorbar = func.get_color_bar(self.colormap, self.nc_range, (0.1, 0.1, 0.1), "white", font * 2.5)
+            self.colorbar_key = key
+        return self.colorbar
 
     def x_axis(self):
         """
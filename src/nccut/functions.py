@@ -20,11 +20,10 @@ from kivy.core.image import Image as CoreImage
 import kivy.uix as ui
 from kivy.uix.textinput import TextInput
 from plyer import filechooser
-from functools import partial
-from scipy.interpolate import RegularGridInterpolator, CubicSpline
+from functools import partial, lru_cache
 import numpy as np
 from PIL import Image as im
-import math
+from PIL import ImageStat
 import io
 import warnings
 import itertools
@@ -34,10 +33,24 @@ import subprocess
 from pathlib import Path
 import tomli
 import os
-import re
+import string
 import datetime
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+
+# Characters allowed in output file names and in paths of files to load
+VALID_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_-/:\\")
+VALID_PATH_CHARS = VALID_NAME_CHARS | {"."}
+
+# File type of each supported file extension
+FILE_TYPES = {".nc": "netcdf", ".jpg": "image", ".jpeg": "image", ".png": "image"}
+
+# Colormaps available for NetCDF files. Built once as plt.colormaps() sorts the whole colormap registry on every call.
+COLORMAPS = tuple(plt.colormaps()[:87])
+
+# RGB values of the line colors available for transect tools
+LINE_COLORS = {"Blue": (0.28, 0.62, 0.86), "Green": (0.39, 0.78, 0.47), "Orange": (0.74, 0.42, 0.13)}
 
 
 class Click:
@@ -194,7 +207,7 @@ def manual_file_check(file_text, extension, next_function, home):
     path = home.rel_path
     if file_text.find(".") >= 1:
         file_text = file_text[:file_text.find(".")]
-    if file_text == "" or len(re.findall(r'[^A-Za-z0-9_\-/:\\]', file_text)) > 0:
+    if file_text == "" or not VALID_NAME_CHARS.issuperset(file_text):
         alert_popup("Invalid file name")
         return False
     if "/" in file_text:
@@ -202,17 +215,17 @@ def manual_file_check(file_text, extension, next_function, home):
             alert_popup("Directory not found")
             return False
 
-    exist = True
+    # List the directory once to skip past taken numbered names. Names are still checked on disk before being used
+    # since the listing is case-sensitive but the file system may not be
+    f_path = path / file_text
+    existing = {entry.name for entry in os.scandir(f_path.parent)}
     fcount = 0
-    while exist:
-        if Path.exists(path / (file_text + extension)):
-            fcount += 1
-            if fcount == 1:
-                file_text = file_text + "(1)"
-            else:
-                file_text = file_text[:file_text.find("(") + 1] + str(fcount) + ")"
-        else:
-            exist = False
+    f_name = f_path.name + extension
+    while f_name in existing or os.path.exists(f_path.parent / f_name):
+        fcount += 1
+        f_name = f_path.name + "(" + str(fcount) + ")" + extension
+    if fcount > 0:
+        file_text = file_text + "(" + str(fcount) + ")"
     fpath = os.path.abspath(file_text + extension)
     next_function(fpath)
 
@@ -232,7 +245,7 @@ def validate_config(config):
     xyz = [list(i) for i in list(itertools.permutations(["x", "y", "z"], 3))]
     allowed_options = {"graphics_defaults": {"contrast": np.arange(-20, 21).astype(int),
                                              "line_color": ["Blue", "Orange", "Green"],
-                                             "colormap": plt.colormaps()[:87],
+                                             "colormap": COLORMAPS,
                                              "circle_size": np.arange(2, 71).astype(int),
                                              "font_size": np.arange(8, 21)},
                        "tool_defaults": {"orthogonal_width": np.arange(0, 401).astype(int)},
@@ -270,6 +283,7 @@ def convert_found_coords(found, config):
     Returns:
         The original found list except the Click points have been converted to pixel coordinates
     """
+    from scipy.interpolate import CubicSpline
     for chain in found:
         for i, c in enumerate(["x", "y"]):
             coords = config["netcdf"]["data"].coords[config["netcdf"][c]].data.astype(float)
@@ -325,7 +339,7 @@ def find_config(config_file):
 
 def chain_find(data, res, need, c_type):
     """
-    Recursively examines dictionary and determines if dictionary is valid project file containing the needed fields.
+    Examines nested dictionary and determines if dictionary is valid project file containing the needed fields.
 
     Args:
         data (dict): Dictionary to examine
@@ -340,31 +354,25 @@ def chain_find(data, res, need, c_type):
         If no qualifying data was found returns empty list. If duplicate data is found (ex: multiple
         variables in a file) only returns one instance of orthogonal chain data.
     """
-    for key in list(data.keys()):
-        if key[0:len(c_type)] == c_type:
-            if correct_test(data[key], need):  # Orthogonal chain dict has necessary fields
-                if len(res) == 0:  # If res empty, always add orthogonal chain data
-                    new_items = []
-                    for i in range(len(need)):
-                        new_items.append(data[key][need[i]])
-                    res.append(new_items)
-                else:  # If res not empty, ensure found orthogonal chain data isn't already in res
-                    new = True
-                    for item in res:
-                        l1 = data[key][need[0]]
-                        l2 = item[0]
-                        if len(l1) == len(l2) and len(l1) == sum([1 for i, j in zip(l1, l2) if i == j]):
-                            new = False
-                    if new:
-                        new_items = []
-                        for i in range(len(need)):
-                            new_items.append(data[key][need[i]])
-                        res.append(new_items)
-        else:
-            if type(data[key]) is dict:  # Can still go further in nested dictionary tree
-                chain_find(data[key], res, need, c_type)
+    # Nested dictionaries are walked with a stack of their item iterators rather than recursively. Click coordinates of
+    # chains already found are kept in a set so duplicates are skipped without comparing against every found chain.
+    seen = {tuple(item[0]) for item in res}
+    stack = [iter(data.items())]
+    while stack:
+        for key, value in stack[-1]:
+            if key.startswith(c_type):
+                # Chain dict has necessary fields and isn't already in res
+                if correct_test(value, need) and tuple(value[need[0]]) not in seen:
+                    seen.add(tuple(value[need[0]]))
+                    res.append([value[field] for field in need])
+            elif type(value) is dict:  # Can still go further in nested dictionary tree
+                stack.append(iter(value.items()))
+                break
             else:
-                return res
+                stack.pop()
+                break
+        else:
+            stack.pop()
     return res
 
 
@@ -380,12 +388,11 @@ def correct_test(data, need):
     Returns:
         Boolean, whether dictionary has necessary keys with a list has the value
     """
-    keys = list(data.keys())
-    if len(keys) == 0:
+    if len(data) == 0:
         return False
     else:
         for item in need:
-            if item not in keys or not isinstance(data[item], list):
+            if item not in data or not isinstance(data[item], list):
                 return False
     return True
 
@@ -410,6 +417,77 @@ def contrast_function(value):
     return contrast
 
 
+def colormap_indices(n_data, n_colors):
+    """
+    Finds the index of the color each data value is assigned in a colormap, the same way matplotlib assigns them.
+
+    Indices only depend on the number of colors in the colormap, so they can be shared by colormaps of the same size.
+
+    Args:
+        n_data: 2D array of data normalized from 0 to 1
+        n_colors (int): Number of colors in the colormap
+
+    Returns:
+        2D array of colormap indices. NaN values are given the index one past the last color in the colormap.
+    """
+    idx = n_data * n_colors
+    np.minimum(idx, n_colors - 1, out=idx)
+    idx[np.isnan(n_data)] = n_colors
+    return idx.astype(np.intp)
+
+
+@lru_cache(maxsize=None)
+def colormap_lut(colormap):
+    """
+    Builds a lookup table of a colormap's colors as 8 bit RGBA with white appended at the end for NaN values.
+
+    Args:
+        colormap (str): Name of matplotlib colormap
+
+    Returns:
+        Read only uint8 array of RGBA colors with shape (number of colors + 1, 4) and read only uint8 array of the
+        gray level of each color
+    """
+    cmap = plt.get_cmap(colormap)
+    colors = np.vstack((cmap(np.arange(cmap.N), bytes=True), np.full((1, 4), 255, np.uint8)))
+    grays = np.asarray(im.fromarray(colors[np.newaxis]).convert("L"))[0]
+    colors.flags.writeable = False
+    grays.flags.writeable = False
+    return colors, grays
+
+
+def colormap_image(n_data, colormap, contrast, indices=None, out=None):
+    """
+    Colors normalized data with a colormap and applies contrast in a single lookup into the colormap.
+
+    Gives the same result as applying the colormap and then PIL's contrast enhancement to the whole image, but the
+    contrast is only applied to the colormap's colors, weighted by how many pixels use each color.
+
+    Args:
+        n_data: 2D array of data normalized from 0 to 1
+        colormap (str): Name of matplotlib colormap
+        contrast (float): Contrast value to apply (see :meth:`nccut.functions.contrast_function`)
+        indices: (Optional) Colormap indices of the data from :meth:`nccut.functions.colormap_indices` if they have
+            already been found
+        out: (Optional) uint8 array of shape (rows, columns, 4) to write the pixels into instead of a new array
+
+    Returns:
+        3D uint8 array of RGBA pixels. NaN values are white.
+    """
+    colors, grays = colormap_lut(colormap)
+    n_colors = len(colors) - 1
+    idx = colormap_indices(n_data, n_colors) if indices is None else indices
+    lut = im.fromarray(colors[np.newaxis])
+    # Mean gray level of the colored image which PIL's contrast enhancement scales around
+    counts = np.bincount(idx.ravel(), minlength=n_colors + 1)
+    hist = np.bincount(grays, weights=counts, minlength=256)
+    mean = int(ImageStat.Stat(hist.astype(np.int64).tolist()).mean[0] + 0.5)
+    degenerate = im.new("L", lut.size, mean).convert("RGBA")
+    degenerate.putalpha(lut.getchannel("A"))
+    # Indices are always in range, and unlike the default mode, clip writes straight into out without a temporary copy
+    return np.asarray(im.blend(degenerate, lut, contrast))[0].take(idx, axis=0, out=out, mode='clip')
+
+
 def text_wrap(*args):
     """
     Updates a widgets text box so that it is always within the bounds of the widget.
@@ -447,7 +525,7 @@ def alert(text, home):
     screen = kivy.core.window.Window.size
     with home.canvas:
         Color(0.2, 0.2, 0.2)
-        box = Rectangle(pos=(dp(10), kivy.core.window.Window.size[1] - dp(60)), size=(dp(300), dp(50)))
+        box = Rectangle(pos=(dp(10), screen[1] - dp(60)), size=(dp(300), dp(50)))
     aler = Label(text=text, size=home.size, pos=(-(screen[0] / 2) + dp(160), screen[1] / 2 - dp(35)))
     home.add_widget(aler)
     kivy.clock.Clock.schedule_once(partial(remove_alert, aler, home), 2)
@@ -679,7 +757,7 @@ def get_color_bar(colormap, data, face_color, text_color, font):
 
     Args:
         colormap: cv2 colormap
-        data: 2D indexable array of numerical data to apply the to
+        data: Array of numerical data the colorbar is for. Only its minimum and maximum are used.
         face_color: Color (R, G, B) to use as the background color for the image
         text_color (str): Color to use as text color
         font (float): Font to use for tick labels
@@ -687,12 +765,12 @@ def get_color_bar(colormap, data, face_color, text_color, font):
     Returns:
         kivy.uix.image.Image object containing image of colorbar
     """
-    c_arr = (np.arange(0, 256) * np.ones((10, 256))).astype(np.uint8).T
+    c_arr = np.broadcast_to(np.arange(0, 256, dtype=np.uint8)[:, None], (256, 10))
     c_bar = plt.get_cmap(colormap)(c_arr)
-    plt.figure(figsize=(1, 30))
-    plt.imshow(c_bar, origin="lower")
-
-    ax = plt.gca()
+    # Drawn on a standalone figure so the colorbar doesn't go through pyplot's figure manager
+    fig = Figure(figsize=(1, 30))
+    ax = fig.gca()
+    ax.imshow(c_bar, origin="lower")
     ax.get_xaxis().set_visible(False)
     with warnings.catch_warnings(record=True):
         d_min = np.nanmin(data)
@@ -717,7 +795,7 @@ def get_color_bar(colormap, data, face_color, text_color, font):
         else:
             formatted_labels = [round(elem, 2) for elem in s_labels]
             exp_str = ""
-        ticks = [((c - np.nanmin(data)) / (np.nanmax(data) - np.nanmin(data))) * 256 for c in s_labels]
+        ticks = [((c - d_min) / (d_max - d_min)) * 256 for c in s_labels]
         ax.set_yticks(ticks=ticks, labels=formatted_labels, fontsize=font)
         ax.yaxis.label.set_color(text_color)
         ax.tick_params(axis='y', colors=text_color)
@@ -725,10 +803,9 @@ def get_color_bar(colormap, data, face_color, text_color, font):
         exp_str = "NaN"
     ax.set_title("        " + exp_str, color=text_color, fontsize=font)
     temp = io.BytesIO()
-    plt.savefig(temp, facecolor=face_color, bbox_inches='tight', format="png")
+    fig.savefig(temp, facecolor=face_color, bbox_inches='tight', format="png")
     temp.seek(0)
-    plt.close()
-    plot = ui.image.Image(source="", texture=CoreImage(io.BytesIO(temp.read()), ext="png").texture)
+    plot = ui.image.Image(source="", texture=CoreImage(temp, ext="png").texture)
     return plot
 
 
@@ -777,6 +854,59 @@ def add_metadata(config, f_type, home, dicti):
     return dicti
 
 
+def json_default(obj):
+    """
+    Converts numpy arrays and scalars in transect data to JSON serializable types. Pass as the default argument of
+    json.dump so transect data only becomes Python lists when it is written.
+
+    Args:
+        obj: Object the json module couldn't serialize
+
+    Returns:
+        List or Python scalar equivalent of obj
+    """
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@lru_cache(maxsize=1)
+def image_array(path, mtime):
+    """
+    Decodes an image file into an array flipped to match the display's coordinates.
+
+    Transects taken on the same image reuse the decoded array instead of reading the file again for every transect.
+    The array is read only since it is shared between calls.
+
+    Args:
+        path (str): File path of image
+        mtime (float): Modification time of the file so the cache is refreshed if the file changes
+
+    Returns:
+        Read only array of image pixels with the first row at the bottom of the image
+    """
+    img = np.flip(np.asarray(im.open(path)), 0)
+    img.flags.writeable = False
+    return img
+
+
+def z_positions(z_coord):
+    """
+    Maps each value of a NetCDF z coordinate to its position in the z dimension.
+
+    Z values are selected in the app as strings, so looking up their position and selecting by position works for any
+    coordinate type without converting the coordinate itself. Found once when a NetCDF file is loaded and kept in its
+    configuration as 'z_positions'.
+
+    Args:
+        z_coord: 1D array of z coordinate values
+
+    Returns:
+        Dictionary of the position of each z value keyed by the value as a string
+    """
+    return {z: i for i, z in enumerate(np.asarray(z_coord).astype(str))}
+
+
 def subset_around_transect(config, points):
     """
     Determines and loads a subset of the data that surrounds the transect.
@@ -791,34 +921,31 @@ def subset_around_transect(config, points):
         Subset of data, rescaled points [X1, Y1, X2, Y2], list of [X, Y] rescale factors>. If passed data is an
         image doesn't do sub-secting since efficiency is less of an issue.
     """
+    from scipy.interpolate import RegularGridInterpolator
     if isinstance(config, str):
         # Don't subsect if image file
-        img = np.flip(np.asarray(im.open(config)), 0)
-        return img, points, [0, 0]
+        return image_array(config, os.path.getmtime(config)), points, [0, 0]
     elif config['z'] == 'N/A':
         # 2D NetCDF data
         ds = config['data'][config['var']].rename({config['y']: 'y', config['x']: 'x'})
     else:
         # 3D NetCDF data
         ds = config['data'][config['var']].rename({config['y']: 'y', config['x']: 'x', config['z']: 'z'})
-        ds['z'] = ds['z'].astype(str)
-        ds = ds.sel(z=config["z_val"])
+        # Z value is a string so select it by position, using the positions found once when the file was loaded
+        ds = ds.isel(z=config["z_positions"][config["z_val"]])
     ds["x"] = ds["x"].astype(float)
     ds["y"] = ds["y"].astype(float)
 
     x_points = np.sort(np.array([points[0], points[2]]))
     y_points = np.sort(np.array([points[1], points[3]]))
 
-    # Get original coordinates in ascending order
+    # Get original coordinates in ascending order. Reversing is done lazily so no data is read yet
     if ds["x"][1] < ds["x"][0]:
-        og_x = ds["x"][::-1]
-    else:
-        og_x = ds["x"]
-
+        ds = ds.isel(x=slice(None, None, -1))
     if ds["y"][1] < ds["y"][0]:
-        og_y = ds["y"][::-1]
-    else:
-        og_y = ds["y"]
+        ds = ds.isel(y=slice(None, None, -1))
+    og_x = ds["x"]
+    og_y = ds["y"]
 
     # Create new, equidistant coordinate arrays
     x_pix = min(abs(og_x.data[:-1] - og_x.data[1:]))
@@ -832,12 +959,14 @@ def subset_around_transect(config, points):
     y_vals = y_points * y_pix + curr_y.min()
 
     # Determine original data to grab that surrounds selected points
-    sub_x = og_x[np.searchsorted(og_x, x_vals[0]) - 1:np.searchsorted(og_x, x_vals[1]) + 1]
+    x_slice = slice(np.searchsorted(og_x, x_vals[0]) - 1, np.searchsorted(og_x, x_vals[1]) + 1)
+    sub_x = og_x[x_slice]
     new_x = np.arange(sub_x[0], sub_x[-1] + x_pix, x_pix)
-    sub_y = og_y[np.searchsorted(og_y, y_vals[0]) - 1:np.searchsorted(og_y, y_vals[1]) + 1]
+    y_slice = slice(np.searchsorted(og_y, y_vals[0]) - 1, np.searchsorted(og_y, y_vals[1]) + 1)
+    sub_y = og_y[y_slice]
     new_y = np.arange(sub_y[0], sub_y[-1] + y_pix, y_pix)
-    # Select subset
-    sub_data = ds.sel({"x": sub_x, "y": sub_y})
+    # Select subset by position so only a contiguous block is read from the file
+    sub_data = ds.isel(x=x_slice, y=y_slice)
     sub_data = sub_data.transpose("y", "x")
     # Shift points to subset coordinate system
 
@@ -855,6 +984,31 @@ def subset_around_transect(config, points):
     return interp_data, new_points, [new_x.min() - og_x.data.min(), new_y.min() - og_y.data.min()]
 
 
+def bilinear_sample(z, rows, cols):
+    """
+    Bilinearly interpolates a 2D array at fractional row, column positions.
+
+    Points outside the array are linearly extrapolated from the nearest two rows and columns.
+
+    Args:
+        z: 2D array of data values
+        rows: 1D array of row positions of each point
+        cols: 1D array of column positions of each point
+
+    Returns:
+        1D float array of interpolated values at each point
+    """
+    r0 = np.clip(np.floor(rows).astype(int), 0, max(z.shape[0] - 2, 0))
+    c0 = np.clip(np.floor(cols).astype(int), 0, max(z.shape[1] - 2, 0))
+    r1 = np.minimum(r0 + 1, z.shape[0] - 1)
+    c1 = np.minimum(c0 + 1, z.shape[1] - 1)
+    dr = rows - r0
+    dc = cols - c0
+    top = z[r0, c0] * (1 - dc) + z[r0, c1] * dc
+    bottom = z[r1, c0] * (1 - dc) + z[r1, c1] * dc
+    return (top * (1 - dr) + bottom * dr).astype(float)
+
+
 def ip_get_points(line, curr, config):
     """
     Creates a data frame containing x, y, and value of points on transect line
@@ -879,6 +1033,7 @@ def ip_get_points(line, curr, config):
             'Cut': 1D array of data values at each point along line connecting end points. If from an image the data
                 value is the mean of the pixel RGB values. If from a NetCDF file the data comes from the loaded Dataset.
     """
+    from scipy.interpolate import CubicSpline
 
     # If angle of line is > 45 degrees will swap x and y to increase accuracy
     xyswap = False
@@ -889,50 +1044,63 @@ def ip_get_points(line, curr, config):
         flipped = True
         line = [line[2], line[3], line[0], line[1]]
 
-    # Calculate slope
-    if line[2] - line[0] == 0:
-        m = (line[3] - line[1]) / .001
-    else:
-        m = (line[3] - line[1]) / (line[2] - line[0])
     # If slope greater than 45 deg swap x, y
-    if abs(math.atan(m)) > (math.pi / 4):
+    if abs(line[3] - line[1]) > abs(line[2] - line[0]):
         xyswap = True
         line = [line[1], line[0], line[3], line[2]]
-        # Recalculate slope with new order
-        if line[2] - line[0] == 0:
-            m = (line[3] - line[1]) / .001
-        else:
-            m = (line[3] - line[1]) / (line[2] - line[0])
         x_lab = "y"
         y_lab = "x"
     else:
         x_lab = "x"
         y_lab = "y"
+    # After any swap the x distance is at least the y distance so the slope is only undefined for a single point
+    if line[2] - line[0] == 0:
+        m = 0.0
+    else:
+        m = (line[3] - line[1]) / (line[2] - line[0])
     b = line[1] - m * (line[0])
-    # Get interpolation object
-    ix = np.arange(0, img.shape[1])
-    iy = np.arange(0, img.shape[0])
-    z = img[(img.shape[0] - 1 - iy[-1]):(img.shape[0] - iy[0]), ix[0]:ix[-1] + 1]
-
-    if list(config.keys())[0] == "image" and len(z.shape) == 3:
-        # If file is an image, take average of RGB values as point value
-        z = np.mean(z, axis=2)
-
-    int_pol = RegularGridInterpolator((iy, ix), z, method='linear', bounds_error=False, fill_value=None)
     if line[0] > line[2]:
         xarr = np.arange(int(line[2]), int(line[0]))
     else:
         xarr = np.arange(int(line[0]), int(line[2]))
-    yarr = xarr * m + b
+    yarr = xarr * m
+    yarr += b
+    # Row, column pixel coordinates of every point so all points are interpolated in a single call
     if not xyswap:
-        points = list(zip(yarr, xarr))
+        coords = np.vstack([yarr, xarr])
+    else:
+        coords = np.vstack([xarr, yarr])
+    # Only the cells interpolated between are needed. bilinear_sample reads the cell a point's row, column falls in,
+    # clipped to the second last index, and the one after, so the strip of those cells gives the same values as the
+    # full array, including points past the edge and NaN neighbours.
+    last = np.maximum(np.array(img.shape[:2]) - 2, 0)
+    if coords.shape[1] > 0:
+        lo = np.clip(np.floor(coords.min(axis=1)).astype(int), 0, last)
+        hi = np.clip(np.floor(coords.max(axis=1)).astype(int), 0, last) + 1
     else:
-        points = list(zip(xarr, yarr))
-    # Grab points from interpolation object
-    data = int_pol(points)
+        lo = np.zeros(2, dtype=int)
+        hi = lo + 1
+    z = img[lo[0]:hi[0] + 1, lo[1]:hi[1] + 1]
+    coords -= lo[:, None]
+
+    f_type = next(iter(config))
+    if f_type == "image" and len(z.shape) == 3:
+        # If file is an image, take average of RGB values as point value. Summing the channels with einsum skips the
+        # strided reduction np.mean does and gives identical values.
+        z = np.einsum('ijk->ij', z, dtype=np.float64) / z.shape[2]
+
+    # Points that all fall on a pixel inside the array (eg. horizontal, vertical, 45 degree lines) interpolate to the
+    # pixel values themselves, so they can be read directly. Neighbours still carry NaN into the interpolation with a
+    # weight of zero, so only do this when the strip is all finite values.
+    on_pixels = coords.shape[1] > 0 and np.array_equal(yarr, np.round(yarr))
+    on_pixels = on_pixels and coords.min() >= 0 and bool((coords.max(axis=1) <= np.array(z.shape[:2]) - 1).all())
+    if on_pixels and np.isfinite(z).all():
+        data = z[coords[0].astype(int), coords[1].astype(int)].astype(float)
+    else:
+        data = bilinear_sample(z, coords[0], coords[1])
     # If NetCDF and valid coordinate data is available, return that
 
-    if list(config.keys())[0] == "netcdf":
+    if f_type == "netcdf":
         x_coord = config["netcdf"]["data"].coords[config["netcdf"][x_lab]].data
         y_coord = config["netcdf"]["data"].coords[config["netcdf"][y_lab]].data
         try:
@@ -968,5 +1136,4 @@ def ip_get_points(line, curr, config):
         data = {x_name: yarr, y_name: xarr, 'Cut': data}
     else:
         data = {x_name: xarr, y_name: yarr, 'Cut': data}
-    data = {x_name: data[x_name].tolist(), y_name: data[y_name].tolist(), 'Cut': data['Cut'].tolist()}
     return data
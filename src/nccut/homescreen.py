@@ -16,7 +16,6 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.widget import Widget
 from kivy.graphics import Color, RoundedRectangle
 from kivy.metrics import dp
-import re
 import os
 import platform
 import subprocess
@@ -94,8 +93,7 @@ class HomeScreen(Screen):
             elements (list): List of widgets to add. Assumes all have the same height.
         """
         dsl = self.ids.dynamic_sidebar
-        for i in range(len(dsl.children)):
-            dsl.remove_widget(dsl.children[0])
+        dsl.clear_widgets()
         for el in elements:
             dsl.add_widget(el)
         dsl.add_widget(self.sidebar_spacer)
@@ -119,7 +117,7 @@ class HomeScreen(Screen):
             if self.file:
                 self.ids.file_in.text = str(self.file)
                 self.load_btn()
-                if str(self.file)[-3:] == ".nc":
+                if func.FILE_TYPES.get(os.path.splitext(self.file)[1]) == "netcdf":
                     self.nc_popup.load.dispatch("on_press")
             self.loaded = True
 
@@ -153,31 +151,29 @@ class HomeScreen(Screen):
         self.ids.file_in.text = self.ids.file_in.text.strip()
         file = self.ids.file_in.text
         # Limit file names to alphanumeric characters and _-./
-        if file == "" or len(re.findall(r'[^A-Za-z0-9_:\\.\-/]', file)) > 0:
+        if file == "" or not func.VALID_PATH_CHARS.issuperset(file):
             func.alert("Invalid File Name", self)
             self.clean_file()
+        elif not os.path.isfile(file):
+            func.alert("File Not Found", self)
+            self.clean_file()
         else:
-            try:
-                open(file)
-                if file[-3:] == ".nc":
-                    # Creates selection popup for nc file data sets
-                    self.nc_popup = NetCDFConfig(file, self, self.general_config["netcdf"]["dimension_order"])
+            f_type = func.FILE_TYPES.get(os.path.splitext(file)[1])
+            if f_type == "netcdf":
+                # Creates selection popup for nc file data sets
+                self.nc_popup = NetCDFConfig(file, self, self.general_config["netcdf"]["dimension_order"])
 
-                elif file[-5:] == ".jpeg" or file[-4:] == ".png" or file[-4:] == ".jpg":
-                    # Creates interactive image from .jpg/.png/.jpeg files
-                    self.display = FileDisplay(home=self, f_config={"image": str(file)},
-                                               g_config=self.general_config["graphics_defaults"],
-                                               t_config=self.general_config["tool_defaults"])
-                    self.ids.view.add_widget(self.display)
-                    if self.settings_bar.parent is None:
-                        self.ids.settings_bar.add_widget(self.settings_bar)
-                    self.file_on = True
-                else:
-                    func.alert("Unsupported File Type", self)
-                    self.clean_file()
-
-            except FileNotFoundError:
-                func.alert("File Not Found", self)
+            elif f_type == "image":
+                # Creates interactive image from .jpg/.png/.jpeg files
+                self.display = FileDisplay(home=self, f_config={"image": str(file)},
+                                           g_config=self.general_config["graphics_defaults"],
+                                           t_config=self.general_config["tool_defaults"])
+                self.ids.view.add_widget(self.display)
+                if self.settings_bar.parent is None:
+                    self.ids.settings_bar.add_widget(self.settings_bar)
+                self.file_on = True
+            else:
+                func.alert("Unsupported File Type", self)
                 self.clean_file()
 
     def browse(self):
@@ -302,10 +298,10 @@ class HomeScreen(Screen):
             def_img_name = self.general_config["graphics_defaults"]["line_color"].lower() + "_line_btn.png"
             self.settings_bar.set_line_color_btn(os.path.join(self.btn_img_path, def_img_name))
             self.display.parent.remove_widget(self.display)
+            # Release the decoded image kept for taking transects
+            func.image_array.cache_clear()
             # Reset Sidebar
-            dsl = self.ids.dynamic_sidebar
-            for i in range(len(dsl.children)):
-                dsl.remove_widget(dsl.children[0])
+            self.ids.dynamic_sidebar.clear_widgets()
         if self.settings_bar.parent is not None:
             self.ids.settings_bar.remove_widget(self.settings_bar)
         self.settings_bar.remove_netcdf_button()
@@ -9,6 +9,7 @@ from kivy.metrics import dp
 from kivy.graphics import Color, Ellipse, Line
 from kivy.uix.label import Label
 from kivy.core.window import Window
+import nccut.functions as functions
 
 
 class InlineChain(ui.widget.Widget):
@@ -50,12 +51,7 @@ class InlineChain(ui.widget.Widget):
         self.size = self.home.display.size
         self.pos = self.home.display.pos
         color = self.home.display.l_col
-        if color == "Blue":
-            self.l_color = Color(0.28, 0.62, 0.86)
-        elif color == "Green":
-            self.l_color = Color(0.39, 0.78, 0.47)
-        elif color == "Orange":
-            self.l_color = Color(0.74, 0.42, 0.13)
+        self.l_color = Color(*functions.LINE_COLORS[color])
         size = self.home.display.cir_size
         self.c_size = (dp(size), dp(size))
         self.line_width = dp(size / 5)
@@ -67,12 +63,7 @@ class InlineChain(ui.widget.Widget):
         Args:
             color (str): New line color to use
         """
-        if color == "Blue":
-            self.l_color = Color(0.28, 0.62, 0.86)
-        elif color == "Green":
-            self.l_color = Color(0.39, 0.78, 0.47)
-        elif color == "Orange":
-            self.l_color = Color(0.74, 0.42, 0.13)
+        self.l_color = Color(*functions.LINE_COLORS[color])
         groups = []
         for c in range(1, self.clicks + 1):
             group = self.canvas.get_group(str(c))
@@ -133,7 +124,7 @@ class InlineChain(ui.widget.Widget):
             self.remove_widget(self.children[0])
             # Stop drawing line between last point and cursor
             Window.unbind(mouse_pos=self.draw_line)
-        self.points.remove(self.points[-1])
+        self.points.pop()
         self.canvas.remove_group(str(self.clicks))
         self.canvas.remove_group(str(self.clicks + 1))
         self.clicks -= 1
@@ -147,22 +138,22 @@ class InlineChain(ui.widget.Widget):
         """
         # Draws chain line and points.
         proceed = False
+        view = self.home.ids.view
         if self.loaded:  # If being loaded, just needs to be within image bounds
             if touch.pos[0] < self.size[0] and touch.pos[1] < self.size[1]:
                 proceed = True
             else:
                 self.parent.load_fail_alert()  # Load failed
-        elif self.home.ids.view.collide_point(*self.home.ids.view.to_widget(*self.to_window(*touch.pos))):
+        elif view.collide_point(*view.to_widget(*self.to_window(*touch.pos))):
             proceed = True
         if proceed:
             if self.clicks > 1 and (touch.x, touch.y) == self.points[-1]:
                 return
             else:
-                par = self.home.display.children[0].children[-2]
                 self.clicks += 1
                 with self.canvas:
                     # Always adds point when clicked
-                    Color(self.l_color.r, self.l_color.g, self.l_color.b)
+                    Color(*self.l_color.rgb)
                     Ellipse(pos=(touch.x - self.c_size[0] / 2, touch.y - self.c_size[1] / 2),
                             size=self.c_size, group=str(self.clicks))
                     self.points.append((touch.x, touch.y))
@@ -172,13 +163,14 @@ class InlineChain(ui.widget.Widget):
                 if self.clicks > 1:
                     # If 2nd or more click, create a line inbetween click points
                     with self.canvas:
-                        Color(self.l_color.r, self.l_color.g, self.l_color.b)
+                        Color(*self.l_color.rgb)
                         line = Line(points=[self.points[-2][0:2], self.points[-1][0:2]],
                                     width=self.line_width, group=str(self.clicks))
                     # Store line
                     self.transects.append(line)
                 else:
                     # If first click, adds chain number
+                    par = self.home.display.children[0].children[-2]
                     self.number = Label(text=str(len(par.children)), pos=(touch.x, touch.y), font_size=self.c_size[0] * 2)
                     self.add_widget(self.number)
 
@@ -194,12 +186,13 @@ class InlineChain(ui.widget.Widget):
             pos (tuple): 2 element tuple of floats, x and y coord of cursor position
         """
         if self.parent.children[0] == self and not self.parent.dragging:
-            if self.home.ids.view.collide_point(*self.home.ids.view.to_widget(*pos)):
+            view = self.home.ids.view
+            if view.collide_point(*view.to_widget(*pos)):
                 mouse = self.to_widget(*pos)
                 if self.size[0] >= mouse[0] >= 0 and self.size[1] >= mouse[1] >= 0:
-                    with self.canvas:
-                        Color(self.l_color.r, self.l_color.g, self.l_color.b)
-                        self.curr_line.points = [self.points[-1][0:2], self.to_widget(pos[0], pos[1])]
+                    # Line is already on the canvas with its color so only its points need updating
+                    last = self.points[-1]
+                    self.curr_line.points = [last[0], last[1], mouse[0], mouse[1]]
         else:
             # Don't draw if not current chain or in dragging mode
             self.stop_drawing()
@@ -209,5 +202,5 @@ class InlineChain(ui.widget.Widget):
         Remove line from most recent point to cursor.
         """
         with self.canvas:
-            Color(self.l_color.r, self.l_color.g, self.l_color.b)
+            Color(*self.l_color.rgb)
             self.curr_line.points = self.curr_line.points[0:2]
@@ -58,7 +58,7 @@ class InteractivePlot(ScatterLayout):
         maximum possible size.
         """
         self.z_data_to_img()
-        im = CoreImage(io.BytesIO(self.byte.read()), ext='png')
+        im = CoreImage(self.byte, ext='png')
         self.size = im.size
         img = Image(source="", texture=im.texture, size=im.size, pos=self.pos)
         self.add_widget(img)
@@ -80,7 +80,6 @@ class InteractivePlot(ScatterLayout):
         plt.axis('off')
         self.byte = io.BytesIO()
         plt.savefig(self.byte, format="png", bbox_inches='tight', pad_inches=0)
-        plt.savefig("test.png", format="png")
         self.byte.seek(0)
         plt.close()
 
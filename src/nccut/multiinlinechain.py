@@ -6,7 +6,6 @@ Manages having multiple chains on screen at once.
 
 import kivy.uix as ui
 from kivy.core.window import Window
-from scipy.interpolate import CubicSpline
 import numpy as np
 import json
 import nccut.functions as func
@@ -95,12 +94,13 @@ class MultiInlineChain(ui.widget.Widget):
         Args:
             file (str): File path
         """
-        data = json.load(open(file))
+        with open(file) as f:
+            data = json.load(f)
         config = self.home.display.config
         x_name = "X"
         y_name = "Y"
         nc_coords = False
-        if list(config.keys())[0] == "netcdf":
+        if next(iter(config)) == "netcdf":
             try:
                 config["netcdf"]["data"].coords[config["netcdf"]["x"]].data.astype(float)
                 config["netcdf"]["data"].coords[config["netcdf"]["y"]].data.astype(float)
@@ -251,6 +251,7 @@ class MultiInlineChain(ui.widget.Widget):
         """
         Gather points into a dictionary for either plotting or saving
         """
+        from scipy.interpolate import CubicSpline
         frames = {}
         c = 1
         nc_coords = False
@@ -328,8 +329,8 @@ class MultiInlineChain(ui.widget.Widget):
                         x_lab = config[f_type]["x"]
                         y_lab = config[f_type]["y"]
                     final_dict[chain][cut] = func.ip_get_points(sub_p, sub_d, config)
-                    final_dict[chain][cut][x_lab] = [x + float(scales[0]) for x in final_dict[chain][cut][x_lab]]
-                    final_dict[chain][cut][y_lab] = [y + float(scales[1]) for y in final_dict[chain][cut][y_lab]]
+                    final_dict[chain][cut][x_lab] = final_dict[chain][cut][x_lab] + float(scales[0])
+                    final_dict[chain][cut][y_lab] = final_dict[chain][cut][y_lab] + float(scales[1])
                 for field in list(frames[chain].keys())[:2]:
                     final_dict[chain][field] = list(frames[chain][field])
 
@@ -341,8 +342,10 @@ class MultiInlineChain(ui.widget.Widget):
 
             # Add metadata
             final_dict = func.add_metadata(config, f_type, self.home, final_dict)
+            # Encoded in full before writing so the file is written in one go and never left half written
+            encoded = json.dumps(final_dict, default=func.json_default)
             with open(f_path, "w") as f:
-                json.dump(final_dict, f)
+                f.write(encoded)
             func.alert_popup("Download Complete")
         except Exception as error:
             func.alert_popup(str(error))
@@ -356,7 +359,8 @@ class MultiInlineChain(ui.widget.Widget):
             touch: MouseMotionEvent, see kivy docs for details
         """
         if not self.dragging:
-            if self.home.ids.view.collide_point(*self.home.ids.view.to_widget(*self.to_window(*touch.pos))):
+            view = self.home.ids.view
+            if view.collide_point(*view.to_widget(*self.to_window(*touch.pos))):
                 if self.clicks > 0 or touch.button == "left":
                     self.clicks += 1
                     if self.clicks >= 2:
@@ -16,7 +16,6 @@ from kivy.uix.popup import Popup
 from kivy.uix.label import Label
 from kivy.uix.dropdown import DropDown
 import nccut.functions as func
-import xarray as xr
 
 
 class NetCDFConfig(Popup):
@@ -51,6 +50,8 @@ class NetCDFConfig(Popup):
             file (str): File path of NetCDF file. Must exist and be a valid NetCDF file
             home: Reference to root :class:`nccut.homescreen.HomeScreen` instance
         """
+        # xarray, scipy and pandas are imported where they are used so starting the app doesn't wait on them
+        import xarray as xr
         super(NetCDFConfig, self).__init__(**kwargs)
         self.home = home
         self.font = self.home.font
@@ -62,10 +63,10 @@ class NetCDFConfig(Popup):
         # Variable Selection
         var_box = ui.boxlayout.BoxLayout(spacing=dp(20))
         var_box.add_widget(Label(text="Variable: ", size_hint=(0.3, 1), font_size=self.font))
-        self.var_select = func.RoundedButton(text=list(self.data.keys())[0], size_hint=(0.7, 1),
+        self.var_select = func.RoundedButton(text=next(iter(self.data.data_vars)), size_hint=(0.7, 1),
                                              halign='center', valign='middle', font_size=self.font)
         self.var_drop = DropDown()
-        for item in list(self.data.keys()):
+        for item in self.data.data_vars:
             btn = Button(text=str(item), size_hint_y=None, height=dp(20) + self.font, halign='center',
                          valign='middle', font_size=self.font)
             btn.bind(on_release=lambda btn: self.var_drop.select(btn.text),
@@ -111,7 +112,7 @@ class NetCDFConfig(Popup):
         if self.z_select.text == "N/A":
             d_text = "N/A"
         else:
-            d_text = str(list(self.data.coords[self.z_select.text].data)[0])
+            d_text = str(self.data.coords[self.z_select.text].data[0])
         self.depth_select = func.RoundedButton(text=d_text, size_hint=(0.3, 1), halign='center', valign='middle',
                                                font_size=self.font)
         self.depth_select.bind(size=func.text_wrap, on_release=self.depth_options)
@@ -148,7 +149,7 @@ class NetCDFConfig(Popup):
             *args: Unused args passed by event handler
         """
         if not self.z_select.text == "N/A":
-            self.depth_select.text = str(list(self.data.coords[self.z_select.text].data)[0])
+            self.depth_select.text = str(self.data.coords[self.z_select.text].data[0])
 
     def clean(self):
         """
@@ -189,6 +190,9 @@ class NetCDFConfig(Popup):
                 self.error.text = "All X, Y, Z variables must be unique"
                 self.running = False
                 return
+            # Position of each z value keyed by the value as shown in the app, so z values are never looked up by
+            # converting the z coordinate
+            vals['z_positions'] = None if vals['z'] == 'N/A' else func.z_positions(self.data[vals['z']].data)
             self.home.load_netcdf(vals)
             self.dismiss()
 
@@ -215,7 +219,7 @@ class NetCDFConfig(Popup):
         if self.z_select.text == "N/A":
             setattr(self.depth_select, 'text', "N/A")
         else:
-            setattr(self.depth_select, 'text', str(list(self.data.coords[self.z_select.text].data)[0]))
+            setattr(self.depth_select, 'text', str(self.data.coords[self.z_select.text].data[0]))
 
     def dim_options(self, dim, *args):
         """
@@ -60,12 +60,7 @@ class OrthogonalChain(ui.widget.Widget):
         self.size = self.home.display.size
         self.pos = self.home.display.pos
         color = self.home.display.l_col
-        if color == "Blue":
-            self.l_color = Color(0.28, 0.62, 0.86)
-        elif color == "Green":
-            self.l_color = Color(0.39, 0.78, 0.47)
-        elif color == "Orange":
-            self.l_color = Color(0.74, 0.42, 0.13)
+        self.l_color = Color(*functions.LINE_COLORS[color])
         size = self.home.display.cir_size
         self.c_size = (dp(size), dp(size))
         self.line_width = dp(size / 5)
@@ -77,12 +72,7 @@ class OrthogonalChain(ui.widget.Widget):
         Args:
             color (str): New line color to use
         """
-        if color == "Blue":
-            self.l_color = Color(0.28, 0.62, 0.86)
-        elif color == "Green":
-            self.l_color = Color(0.39, 0.78, 0.47)
-        elif color == "Orange":
-            self.l_color = Color(0.74, 0.42, 0.13)
+        self.l_color = Color(*functions.LINE_COLORS[color])
         groups = []
         for c in range(1, self.clicks + 1):
             group = self.canvas.get_group(str(c))
@@ -136,7 +126,8 @@ class OrthogonalChain(ui.widget.Widget):
 
     def get_orthogonal(self, line_start, line_end):
         """
-        Get a line orthogonal to line drawn by user to use as transect.
+        Get a line orthogonal to line drawn by user to use as transect. Nothing is drawn, see
+        :meth:`nccut.orthogonalchain.OrthogonalChain.draw_orthogonal`.
 
         Args:
             line_start: x, y of start point
@@ -164,7 +155,7 @@ class OrthogonalChain(ui.widget.Widget):
         else:
             m = -1 / m
 
-        if abs(math.atan(m)) > (math.pi / 4):  # If angle of line is > 45 degrees will swap x and y to increase accuracy
+        if abs(m) > 1:  # If angle of line is > 45 degrees will swap x and y to increase accuracy
 
             xyswap = True
             line = [line[1], line[0], line[3], line[2]]
@@ -174,23 +165,30 @@ class OrthogonalChain(ui.widget.Widget):
         mid = (line[0] + (line[2] - line[0]) / 2, line[1] + (line[3] - line[1]) / 2)
         # Calculate orthogonal line points
         b = mid[1] - m * mid[0]
-        xarr = np.arange(int(np.floor(mid[0] - self.t_width / 2)), int(np.floor(mid[0] + self.t_width / 2 + 1)),
-                         dtype=float)
-        yarr = (xarr * m + b).tolist()
-        xarr = xarr.tolist()
+        # Only the end points of the line are needed
+        x_start = float(math.floor(mid[0] - self.t_width / 2))
+        x_end = float(math.floor(mid[0] + self.t_width / 2 + 1) - 1)
+        y_start = x_start * m + b
+        y_end = x_end * m + b
 
-        # Draw points at ends of transect and line between them
+        if xyswap:
+            return [y_start, x_start, y_end, x_end]
+        return [x_start, y_start, x_end, y_end]
+
+    def draw_orthogonal(self, coords):
+        """
+        Draw points at ends of an orthogonal transect and line between them.
+
+        Args:
+            coords: 4 element list of floats, X,Y coords of the two endpoints: [X1, Y1, X2, Y2]
+        """
         with self.canvas:
-            Color(self.l_color.r, self.l_color.g, self.l_color.b)
-            coords = [xarr[0], yarr[0], xarr[-1], yarr[-1]]
-            if xyswap:
-                coords = [yarr[0], xarr[0], yarr[-1], xarr[-1]]
+            Color(*self.l_color.rgb)
             Line(points=[coords[0:2], coords[2:]], width=self.line_width, group=str(self.clicks))
             Ellipse(pos=(coords[0] - self.c_size[0] / 2, coords[1] - self.c_size[1] / 2),
                     size=self.c_size, group=str(self.clicks))
             Ellipse(pos=(coords[2] - self.c_size[0] / 2, coords[3] - self.c_size[1] / 2),
                     size=self.c_size, group=str(self.clicks))
-        return coords
 
     def del_point(self):
         """
@@ -209,7 +207,7 @@ class OrthogonalChain(ui.widget.Widget):
             self.remove_widget(self.children[0])
             # Stop drawing line between last point and cursor
             Window.unbind(mouse_pos=self.draw_line)
-        self.points.remove(self.points[-1])
+        self.points.pop()
         self.canvas.remove_group(str(self.clicks))
         self.canvas.remove_group(str(self.clicks + 1))
         self.clicks -= 1
@@ -223,44 +221,43 @@ class OrthogonalChain(ui.widget.Widget):
         """
         # Draws chain line and points.
         proceed = False
+        view = self.home.ids.view
         if self.loaded:  # If being loaded, just needs to be within image bounds
             if touch.pos[0] < self.size[0] and touch.pos[1] < self.size[1]:
                 proceed = True
             else:
                 self.parent.load_fail_alert()  # Load failed
-        elif self.home.ids.view.collide_point(*self.home.ids.view.to_widget(*self.to_window(*touch.pos))):
+        elif view.collide_point(*view.to_widget(*self.to_window(*touch.pos))):
             proceed = True  # If being clicked, must also be within viewing window
         if proceed:
-            par = self.home.display.children[0].children[-2]
+            point = (touch.x, touch.y, self.t_width)
+            if self.clicks != 0:
+                # Check orthogonal points are within image bounds before anything is drawn
+                coords = self.get_orthogonal(self.points[-1][0:2], point[0:2])
+                if not self.in_bounds(coords):
+                    # Alert user or parent
+                    if self.loaded:
+                        self.parent.load_fail_alert()
+                    else:
+                        functions.alert("Orthogonal point out of bounds", self.home)
+                    return
             self.clicks += 1
             with self.canvas:
                 # Always adds point when clicked
-                Color(self.l_color.r, self.l_color.g, self.l_color.b)
+                Color(*self.l_color.rgb)
                 Ellipse(pos=(touch.x - self.c_size[0] / 2, touch.y - self.c_size[1] / 2),
                         size=self.c_size, group=str(self.clicks))
-                self.points.append((touch.x, touch.y, self.t_width))
+                self.points.append(point)
             # Draw line between last point and cursor whenever cursor position changes
             Window.bind(mouse_pos=self.draw_line)
             if self.clicks != 1:
-                # If 2nd or more click, create a dashed line inbetween click points
+                # If 2nd or more click, create a dashed line inbetween click points and store orthogonal line
                 self.draw_dashed_line(str(self.clicks), self.points[-2][0:2], self.points[-1][0:2])
-                # Stores orthogonal line
-                coords = self.get_orthogonal(self.points[-2][0:2], self.points[-1][0:2])
-                if self.in_bounds(coords):
-                    # Check if orthogonal points are within image bounds
-                    self.transects.append(Line(points=coords, width=self.line_width))
-                else:
-                    # Undo actions and alert user or parent
-                    self.canvas.remove_group(str(self.clicks))
-                    self.clicks -= 1
-                    self.points = self.points[:-1]
-                    if self.loaded:
-                        self.parent.load_fail_alert()
-                    else:
-                        functions.alert("Orthogonal point out of bounds", self.home)
-
+                self.draw_orthogonal(coords)
+                self.transects.append(Line(points=coords, width=self.line_width))
             else:
                 # If first click, adds chain number
+                par = self.home.display.children[0].children[-2]
                 self.number = Label(text=str(len(par.children)), pos=(touch.x, touch.y), font_size=self.c_size[0] * 2)
                 self.add_widget(self.number)
 
@@ -276,11 +273,12 @@ class OrthogonalChain(ui.widget.Widget):
             pos (tuple): 2 element tuple of floats, x and y coord of cursor position
         """
         if self.parent.children[0] == self and not self.parent.dragging:
-            if self.home.ids.view.collide_point(*self.home.ids.view.to_widget(*pos)):
+            view = self.home.ids.view
+            if view.collide_point(*view.to_widget(*pos)):
                 mouse = self.to_widget(*pos)
                 if self.size[0] >= mouse[0] >= 0 and self.size[1] >= mouse[1] >= 0:
                     self.canvas.remove_group("temp")
-                    self.draw_dashed_line("temp", self.points[-1][0:2], self.to_widget(pos[0], pos[1]))
+                    self.draw_dashed_line("temp", self.points[-1][0:2], mouse)
         else:
             # Don't draw if not current chain or in dragging mode
             self.stop_drawing()
@@ -300,11 +298,8 @@ class OrthogonalChain(ui.widget.Widget):
         Returns:
             Boolean whether both endpoints are within image bounds
         """
-        dots = [points[0:2], points[2:4]]
-        for d in dots:
-            if min(d) < 0 or any([i[0] > i[1] for i in list(zip(d, self.size))]):
-                return False
-        return True
+        width, height = self.size
+        return 0 <= points[0] <= width and 0 <= points[1] <= height and 0 <= points[2] <= width and 0 <= points[3] <= height
 
     def draw_dashed_line(self, group, start, end):
         """
@@ -332,7 +327,7 @@ class OrthogonalChain(ui.widget.Widget):
         num_segments = int(distance // segment_length)
 
         with self.canvas:
-            Color(self.l_color.r, self.l_color.g, self.l_color.b)  # Set the color for the line
+            Color(*self.l_color.rgb)  # Set the color for the line
             for i in range(num_segments + 1):
                 # Start point of the dash segment
                 segment_start_x = x1 + i * segment_length * dx
@@ -50,7 +50,7 @@ class OrthogonalChainWidth(Popup):
         # Description of unit coordinate
         x_units = ""
         y_units = ""
-        if list(display.config.keys())[0] == "image":
+        if next(iter(display.config)) == "image":
             x_label = "pixel"
             y_label = "pixel"
         else:
@@ -21,10 +21,8 @@ from nccut.plotwindow import PlotWindow
 from kivy.core.image import Image as CoreImage
 import matplotlib.pyplot as plt
 from PIL import Image as im
-from scipy.interpolate import RegularGridInterpolator
 import numpy as np
 import copy
-import pandas as pd
 import json
 import pathlib
 
@@ -162,11 +160,12 @@ class PlotPopup(Popup):
         self.all_transects = transects
         self.home = home
         self.font = self.home.font
-        self.f_type = list(config.keys())[0]
+        self.f_type = next(iter(config))
         self.config = config
-        if list(self.all_transects.keys())[0][0:-2] == "Orthogonal Chain":
+        first_chain = next(iter(self.all_transects))
+        if first_chain.startswith("Orthogonal Chain"):
             self.t_type = "Orthogonal"
-        elif list(self.all_transects.keys())[0][0:-2] == "Inline Chain":
+        elif first_chain.startswith("Inline Chain"):
             self.t_type = "Inline"
 
         # Create nested dictionary of Booleans indicating which transects are currently selected
@@ -193,7 +192,7 @@ class PlotPopup(Popup):
                     self.active_transects[key] = new
 
         # Start with the first group selected
-        first = list(self.active_transects.keys())[0]
+        first = next(iter(self.active_transects))
         self.active_transects[first] = dict.fromkeys(self.active_transects[first], True)
 
         # If orthogonal chain start with average not selected
@@ -223,7 +222,7 @@ class PlotPopup(Popup):
 
         # Popup Graphics Code
         self.b_height = dp(40) + self.font
-        self.plot = ui.image.Image(source="", texture=CoreImage(io.BytesIO(temp.read()), ext="png").texture,
+        self.plot = ui.image.Image(source="", texture=CoreImage(temp, ext="png").texture,
                                    size_hint=(0.6, 1), fit_mode="contain")
         self.ids.plotting.add_widget(self.plot, len(self.ids.plotting.children))
         self.f_m = 0.8
@@ -295,8 +294,8 @@ class PlotPopup(Popup):
         Cleans plot and optional widgets from plotting popup
         """
         self.ids.plotting.remove_widget(self.plot)
-        while len(self.ids.sidebar.children) > 2:
-            self.ids.sidebar.remove_widget(self.ids.sidebar.children[1])
+        # Keep the first and last sidebar widgets
+        self.ids.sidebar.clear_widgets(self.ids.sidebar.children[1:-1])
         if self.allz_btn:
             self.ids.buttons.remove_widget(self.allz_btn)
             self.allz_btn = None
@@ -418,8 +417,10 @@ class PlotPopup(Popup):
                     for z in list(dat[var].keys()):
                         final[var][z] = self.add_group_info(dat[var][z])
             final = func.add_metadata(self.config, self.f_type, self.home, final)
+            # Encoded in full before writing so the file is written in one go and never left half written
+            encoded = json.dumps(final, default=func.json_default)
             with open(f_path, "w") as f:
-                json.dump(final, f)
+                f.write(encoded)
 
             func.alert_popup("Download Complete")
         except Exception as error:
@@ -454,11 +455,12 @@ class PlotPopup(Popup):
         Returns:
             Dictionary of transect data with non-plotted data fields added back in.
         """
-        if list(dicti.keys())[0][0:10] == "Orthogonal":
+        first_key = next(iter(dicti))
+        if first_key.startswith("Orthogonal"):
             for o in list(dicti.keys()):
                 for key in list(self.all_transects[o].keys())[:3]:
                     dicti[o][key] = list(self.all_transects[o][key])
-        elif list(dicti.keys())[0][0:6] == "Inline":
+        elif first_key.startswith("Inline"):
             for i in list(dicti.keys()):
                 for key in list(self.all_transects[i].keys())[:2]:
                     dicti[i][key] = list(self.all_transects[i][key])
@@ -741,10 +743,7 @@ class PlotPopup(Popup):
             t_count = 0
             for key in list(self.active_transects.keys()):
                 # Count current transects selected
-                no_avg = copy.copy(self.active_transects[key])
-                if "Average" in list(no_avg.keys()):
-                    no_avg.pop("Average")
-                t_count += sum(no_avg.values())
+                t_count += sum(v for t, v in self.active_transects[key].items() if t != "Average")
             if t_count == 1 and len(self.active_vars) == 1:
                 plot_ok = True
         elif self.t_type == "Inline":
@@ -790,6 +789,7 @@ class PlotPopup(Popup):
         Returns:
             3D Array of concatenated transect data over all z values in the NetCDF file.
         """
+        from scipy.interpolate import RegularGridInterpolator
         v = self.active_data[self.active_vars[0]]
         z = v[next(iter(v))]
         chain = next(iter(z))
@@ -846,7 +846,6 @@ class PlotPopup(Popup):
 
         sub_data = ds.sel({"x": sub_x, "y": sub_y})
         sub_data = sub_data.transpose("y", "x", "z")
-        sub_data['z'] = sub_data['z'].astype(str)
         sub_data = sub_data.data
         if ds["z"][1] < ds["z"][0]:
             sub_data = np.flip(sub_data, 2)
@@ -863,13 +862,12 @@ class PlotPopup(Popup):
             X, Y = np.meshgrid(new_x, new_y)
             interp_data = interpolator((Y, X))
             s_points = ((np.array(chain_points["Cut 1"]) * pix_scales) + coord_scales - sub_scales) / pix_scales
-            dat = func.ip_get_points(s_points, interp_data, f_config)["Cut"]
+            dat = [func.ip_get_points(s_points, interp_data, f_config)["Cut"]]
             for tran in list(chain_points.keys())[3:]:
                 s_points = ((np.array(chain_points[tran]) * pix_scales) + coord_scales - sub_scales) / pix_scales
-                res = func.ip_get_points(s_points, interp_data, f_config)["Cut"]
-
-                dat = np.concatenate((dat, res))
-            all_z[z, :] = dat
+                dat.append(func.ip_get_points(s_points, interp_data, f_config)["Cut"])
+            # Join once so chains with many transects aren't copied on every segment
+            all_z[z, :] = np.concatenate(dat)
         return all_z
 
     def get_all_z_orthogonal_chain(self):
@@ -880,6 +878,7 @@ class PlotPopup(Popup):
         Returns:
             3D Array of transect data over all z values in the NetCDF file
         """
+        from scipy.interpolate import RegularGridInterpolator
         # Get transect coordinates
         v = self.active_data[self.active_vars[0]]
         z = v[next(iter(v))]
@@ -923,7 +922,6 @@ class PlotPopup(Popup):
 
         sub_data = ds.sel({"x": sub_x, "y": sub_y})
         sub_data = sub_data.transpose("y", "x", "z")
-        sub_data['z'] = sub_data['z'].astype(str)
         sub_data = sub_data.data
         if ds["z"][1] < ds["z"][0]:
             sub_data = np.flip(sub_data, 2)
@@ -1003,24 +1001,24 @@ class PlotPopup(Popup):
         Returns:
             List of string labels for the plot's legend
         """
+        import pandas as pd
         # Create a non-nested dictionary of selections with appropriate labels
-        dat = copy.copy(data)
         plot_dat = {}
 
-        if list(dat.keys())[0][0:10] != "Orthogonal" and list(dat.keys())[0][0:6] != "Inline":
+        if not next(iter(data)).startswith(("Orthogonal", "Inline")):
             # Gather data for all transects selected across all groups for all Z levels selected
-            for z in list(dat.keys()):
+            for z in data:
                 if len(z) >= 12:
                     z_name = z[:12] + "..."
                 else:
                     z_name = z
-                plot_dat = self.plot_gather_data(dat[z], "Z: " + z_name + " ", plot_dat)
+                plot_dat = self.plot_gather_data(data[z], "Z: " + z_name + " ", plot_dat)
         else:
             # Gather data for all transects selected across all groups
-            plot_dat = self.plot_gather_data(dat, "", plot_dat)
+            plot_dat = self.plot_gather_data(data, "", plot_dat)
 
         # Plot data by turning dictionary into a data frame
-        df = pd.DataFrame.from_dict(dict([(k, pd.Series(v)) for k, v in plot_dat.items()]))
+        df = pd.DataFrame({k: pd.Series(v) for k, v in plot_dat.items()})
         x = np.asarray(df.index)
         axis = (x - x[0]) / (x[-1] - x[0])
         ax.plot(axis, df)
@@ -1051,17 +1049,13 @@ class PlotPopup(Popup):
         Returns:
             Plotting dictionary with chain/transect data added in the correct plotting format
         """
-        for obj in list(dat.keys()):
+        for obj in dat:
             if obj[0:6] == "Inline":
                 title = name_start + "C" + obj[-1]
-                all_trans = np.array(dat[obj]["Cut 1"]["Cut"])
-                for tran in list(dat[obj].keys())[1:]:
-                    n_dat = np.array(dat[obj][tran]["Cut"])
-                    all_trans = np.concatenate((all_trans, n_dat))
-                plot_dat[title] = all_trans
+                plot_dat[title] = np.concatenate([dat[obj][tran]["Cut"] for tran in dat[obj]])
             else:
                 title = name_start + "C" + obj[-1] + " "
-                for tran in list(dat[obj].keys()):
+                for tran in dat[obj]:
                     if tran == "Average":
                         plot_dat[title + tran] = dat[obj][tran]
                     else:
@@ -1078,7 +1072,7 @@ class PlotPopup(Popup):
         plt.savefig(temp, format="png")
         temp.seek(0)
         plt.close()
-        self.plot = ui.image.Image(source="", texture=CoreImage(io.BytesIO(temp.read()), ext="png").texture,
+        self.plot = ui.image.Image(source="", texture=CoreImage(temp, ext="png").texture,
                                    size_hint=(0.7, 1), fit_mode="contain")
         self.ids.plotting.add_widget(self.plot, len(self.ids.plotting.children))
 
@@ -1140,8 +1134,8 @@ class PlotPopup(Popup):
                             x_lab = self.config[self.f_type]["x"]
                             y_lab = self.config[self.f_type]["y"]
                         val_dict[key][tran] = func.ip_get_points(sub_p, sub_d, self.config)
-                        val_dict[key][tran][x_lab] = [x + scales[0] for x in val_dict[key][tran][x_lab]]
-                        val_dict[key][tran][y_lab] = [y + scales[1] for y in val_dict[key][tran][y_lab]]
+                        val_dict[key][tran][x_lab] = val_dict[key][tran][x_lab] + scales[0]
+                        val_dict[key][tran][y_lab] = val_dict[key][tran][y_lab] + scales[1]
 
             if len(val_dict[key]) == 0:
                 val_dict.pop(key)
@@ -0,0 +1,5 @@
+import os
+
+# Must be set before kivy.clock is first imported by any test module. The interrupt clock is not quantized to maxfps
+# so callbacks scheduled by the test harness run on the next tick instead of waiting for a frame boundary.
+os.environ['KIVY_CLOCK'] = 'interrupt'
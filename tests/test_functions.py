@@ -8,10 +8,12 @@ Unit tests to insure transect accuracy and protect from invalid file names
 
 import unittest
 from PIL import Image as Im
+from PIL import ImageEnhance
 import numpy as np
 import json
 import pooch
 import xarray as xr
+import matplotlib.pyplot as plt
 import nccut.functions as func
 
 EXAMPLE_JPG_PATH = pooch.retrieve(url="doi:10.5281/zenodo.14525966/example.jpg",
@@ -100,9 +102,9 @@ class Test(unittest.TestCase):
         # Compare
         self.assertEqual(max(app["Cut"] - manual), 0, "Transect on NetCDF not accurate at zero degrees")
         # Check Coordinates from NetCDF
-        self.assertListEqual(list(dat.coords["i"][points[0]:points[2]]), app["i"],
+        self.assertListEqual(list(dat.coords["i"][points[0]:points[2]]), app["i"].tolist(),
                              "X Coordinates for NetCDF 0 Degree Transect Incorrect")
-        self.assertListEqual(np.repeat(dat.coords["j"][points[1]].data, len(manual)).tolist(), app["j"],
+        self.assertListEqual(np.repeat(dat.coords["j"][points[1]].data, len(manual)).tolist(), app["j"].tolist(),
                              "Y Coordinates for NetCDF 0 DegreeTransect Incorrect")
 
     def test_transect_45_deg_nc(self):
@@ -125,9 +127,9 @@ class Test(unittest.TestCase):
         # Compare
         self.assertEqual(max(app["Cut"] - manual), 0, "Transect on NetCDF not accurate at 45 degrees")
         # Check Coordinates from NetCDF
-        self.assertListEqual(list(dat.coords["i"][points[0]:points[2]]), app["i"],
+        self.assertListEqual(list(dat.coords["i"][points[0]:points[2]]), app["i"].tolist(),
                              "X Coordinates for NetCDF 45 Degree Transect Incorrect")
-        self.assertListEqual(list(dat.coords["j"][points[1]:points[3]]), app["j"],
+        self.assertListEqual(list(dat.coords["j"][points[1]:points[3]]), app["j"].tolist(),
                              "Y Coordinates for NetCDF 45 Degree Transect Incorrect")
 
     def test_transect_90_deg_nc(self):
@@ -148,11 +150,29 @@ class Test(unittest.TestCase):
         # Compare
         self.assertEqual(max(app["Cut"] - manual), 0, "Transect on NetCDF not accurate at 90 degrees")
         # Check Coordinates from NetCDF
-        self.assertListEqual(np.repeat(dat.coords["i"][points[0]].data, len(manual)).tolist(), app["i"],
+        self.assertListEqual(np.repeat(dat.coords["i"][points[0]].data, len(manual)).tolist(), app["i"].tolist(),
                              "X Coordinates for NetCDF 90 Degree Transect Incorrect")
-        self.assertListEqual(list(dat.coords["j"][points[1]:points[3]]), app["j"],
+        self.assertListEqual(list(dat.coords["j"][points[1]:points[3]]), app["j"].tolist(),
                              "Y Coordinates for NetCDF 90 Degree Transect Incorrect")
 
+    def test_transect_zero_length(self):
+        """
+        Test a transect whose end points are the same point has no points instead of failing
+        """
+        # Setup
+        img = Im.open(EXAMPLE_JPG_PATH).convert('RGB')
+        dat = xr.open_dataset(EXAMPLE_3D_PATH)['Theta'].sel(k=-0.5)
+        config = {"netcdf": {"x": "i", "y": "j", "z": "k", "z_val": "-0.5", "var": "Theta", "data": dat}}
+
+        # App result
+        app_img = func.ip_get_points([1000, 200, 1000, 200], img, {"image": EXAMPLE_JPG_PATH})
+        app_nc = func.ip_get_points([100, 50, 100, 50], dat.data, config)
+
+        # Compare
+        self.assertEqual(len(app_img["Cut"]), 0, "Zero length transect on image has points")
+        self.assertEqual(len(app_nc["Cut"]), 0, "Zero length transect on NetCDF has points")
+        self.assertEqual(len(app_nc["i"]), 0, "Zero length transect on NetCDF has X coordinates")
+
     def test_orthogonal_chain_find(self):
         """
         Test whether valid project files can be accurately identified
@@ -206,7 +226,8 @@ class Test(unittest.TestCase):
         """
         netcdf_dat = xr.open_dataset(EXAMPLE_3D_PATH)
         points = [87.987, 694.706, 484.004, 596.626]
-        f_config = {"netcdf": {"data": netcdf_dat, "x": "i", "y": "k", "z": "j", "z_val": "2780", "var": "Theta"}}
+        f_config = {"netcdf": {"data": netcdf_dat, "x": "i", "y": "k", "z": "j", "z_val": "2780", "var": "Theta",
+                               "z_positions": func.z_positions(netcdf_dat["j"].data)}}
         config = f_config["netcdf"]
         dat, sub_points, sub_scales = func.subset_around_transect(config, points)
         val_dict = func.ip_get_points(sub_points, dat, f_config)
@@ -234,6 +255,33 @@ class Test(unittest.TestCase):
         p_error = max(abs(xarray_i_data.data - val_dict["Cut"])) / (max(val_dict["Cut"]) - min(val_dict["Cut"]))
         self.assertTrue(p_error < 0.01, "Resulting transect is not within error bound")
 
+    def test_subset_non_float_z(self):
+        """
+        Test the selected z level is used for transects when the z coordinate is not made of floats
+        """
+        # Setup
+        data = np.arange(3 * 20 * 30, dtype=float).reshape((3, 20, 30))
+        z_coords = {"timedelta": np.array([1, 2, 3], dtype="timedelta64[ns]"),
+                    "datetime": np.array(["2000-01-01", "2000-01-02", "2000-01-03"], dtype="datetime64[ns]"),
+                    "string": np.array(["a", "b", "c"])}
+        points = [3, 4, 12, 9]
+        for name, z in z_coords.items():
+            netcdf_dat = xr.Dataset({"v": (("k", "j", "i"), data)},
+                                    coords={"k": z, "i": np.arange(30.), "j": np.arange(20.)})
+            z_val = str(netcdf_dat["k"].data.astype(str)[1])
+            config = {"data": netcdf_dat, "x": "i", "y": "j", "z": "k", "z_val": z_val, "var": "v",
+                      "z_positions": func.z_positions(netcdf_dat["k"].data)}
+
+            # App result
+            app, _, _ = func.subset_around_transect(config, points)
+
+            # Manual result
+            manual, _, _ = func.subset_around_transect({"data": netcdf_dat.isel(k=1), "x": "i", "y": "j",
+                                                        "z": "N/A", "var": "v"}, points)
+
+            # Compare
+            self.assertTrue(np.array_equal(app, manual), "Wrong z level used for " + name + " z coordinate")
+
     def test_validate_config(self):
         """
         When given a dictionary of configuration values, tests whether the program can identify illegal elements.
@@ -287,6 +335,22 @@ class Test(unittest.TestCase):
                         "metadata": {}}
         self.assertTrue(func.validate_config(legal_config), "Valid config file was deemed invalid.")
 
+    def test_colormap_image(self):
+        """
+        Test that coloring NetCDF data matches applying the colormap and then PIL's contrast enhancement to the image.
+        """
+        data = np.random.default_rng(0).random((40, 60))
+        data[5:10, 20:30] = np.nan
+        data = (data - np.nanmin(data)) / (np.nanmax(data) - np.nanmin(data))
+        for colormap in ["viridis", "gray", "Pastel1"]:
+            for value in [-20, -5, 0, 12, 20]:
+                contrast = func.contrast_function(value)
+                expected = plt.get_cmap(colormap)(data, bytes=True)
+                expected[np.isnan(data)] = 255
+                expected = np.asarray(ImageEnhance.Contrast(Im.fromarray(expected)).enhance(contrast))
+                self.assertTrue(np.array_equal(func.colormap_image(data, colormap, contrast), expected),
+                                "Colored image doesn't match colormap with contrast applied")
+
 
 if __name__ == '__main__':
     unittest.main()
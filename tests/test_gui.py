@@ -8,7 +8,6 @@ Unit tests for GUI functionality
 
 import unittest
 import os
-import time
 import copy
 import pooch
 import json
@@ -50,13 +49,8 @@ class AppInfo:
 run_app = AppInfo()
 
 
-def pause():
-    time.sleep(0.000001)
-
-
 def run_tests(app, *args):
     # Get home root
-    Clock.schedule_interval(pause, 0.000001)
     app.stop()
     run_app.hold_home(app.root.get_screen("HomeScreen"))
 
@@ -65,7 +59,7 @@ def get_app():
     # Run app enough to test without fully loading it
     app = NcCut()
     p = partial(run_tests, app)
-    Clock.schedule_once(p, 0.000001)
+    Clock.schedule_once(p, 0)
     app.run()
 
 
@@ -94,13 +88,19 @@ def load_3d_nc(z_val):
 
 
 def select_sidebar_button(text):
+    select_sidebar_buttons(text)
+
+
+def select_sidebar_buttons(*texts):
+    # Press each button in order. Sidebar children change after every press so each button is looked up again.
     sidebar = run_app.home.ids.dynamic_sidebar
-    but = next((but for but in sidebar.children if isinstance(but, Button) and but.text == text), None)
-    if but:
-        but.dispatch('on_press')
-        but.dispatch('on_release')
-    else:
-        raise Exception("Button not in Sidebar")
+    for text in texts:
+        but = next((but for but in sidebar.children if isinstance(but, Button) and but.text == text), None)
+        if but:
+            but.dispatch('on_press')
+            but.dispatch('on_release')
+        else:
+            raise Exception("Button not in Sidebar")
 
 
 class Test(unittest.TestCase):
@@ -153,7 +153,8 @@ class Test(unittest.TestCase):
                 self.assertListEqual(og_side,
                                      [b.text for b in sidebar if isinstance(b, type(functions.RoundedButton()))],
                                      "Sidebar did not revert to original")
-                self.assertListEqual(og_img, run_app.home.display.children[0].children, "All Tools were not removed")
+                self.assertEqual(tuple(map(id, og_img)), tuple(map(id, run_app.home.display.children[0].children)),
+                                 "All Tools were not removed")
 
     def test_file_cleanup(self):
         """
@@ -297,13 +298,11 @@ class Test(unittest.TestCase):
         self.assertEqual(len(multi_chain_instance.children), 2, "Last chain was not deleted properly")
 
         # Add new chain
-        select_sidebar_button("Back")
-        select_sidebar_button("New Chain")
+        select_sidebar_buttons("Back", "New Chain")
         self.assertEqual(len(multi_chain_instance.children), 3, "New chain was not created")
 
         # Delete point
-        select_sidebar_button("Edit Mode")
-        select_sidebar_button("Delete Last Point")
+        select_sidebar_buttons("Edit Mode", "Delete Last Point")
         self.assertEqual(len(multi_chain_instance.children), 2, "Empty chain was not deleted")
         c2 = cdata["Vorticity"]["Orthogonal Chain 2"]
         c2_expected_points = list(zip(c2["Click x"][:-1], c2["Click y"][:-1], c2["Width"][:-1]))
@@ -317,9 +316,7 @@ class Test(unittest.TestCase):
         select_sidebar_button("Back")
         self.assertNotIn(multi_chain_instance.width_btn, sidebar,
                          "Width adjustment button in sidebar when only one point clicked")
-        select_sidebar_button("Edit Mode")
-        select_sidebar_button("Delete Last Point")
-        select_sidebar_button("Back")
+        select_sidebar_buttons("Edit Mode", "Delete Last Point", "Back")
         self.assertNotIn(multi_chain_instance.p_btn, sidebar,
                          "Plot button not removed from sidebar when no more chains left")
 
@@ -408,8 +405,7 @@ class Test(unittest.TestCase):
                          "A point was added while tool in drag mode")
 
         # Create new chain
-        select_sidebar_button("Transect Mode")
-        select_sidebar_button("New Chain")
+        select_sidebar_buttons("Transect Mode", "New Chain")
         self.assertEqual(len(tran_instance.children), 2, "Inline Chain Not Added")
         select_sidebar_button("New Chain")
         self.assertEqual(len(tran_instance.children), 2,
@@ -421,8 +417,7 @@ class Test(unittest.TestCase):
                          "Point was not added to new chain")
 
         # Edit mode
-        select_sidebar_button("Edit Mode")
-        select_sidebar_button("Delete Last Point")
+        select_sidebar_buttons("Edit Mode", "Delete Last Point")
         self.assertEqual(tran_instance.children[0].points, [], "Chain point was not properly deleted")
         select_sidebar_button("Delete Last Point")
         self.assertEqual(len(tran_instance.children), 1,
@@ -563,8 +558,7 @@ class Test(unittest.TestCase):
         self.assertEqual(display.tool.children[0].c_size, (dp(20), dp(20)),
                          "Inline chain graphics did not update on circle size change")
 
-        select_sidebar_button("Close Tool")
-        select_sidebar_button("Orthogonal Chain")
+        select_sidebar_buttons("Close Tool", "Orthogonal Chain")
         display.tool.on_touch_down(functions.Click(0.43 * x, 0.43 * y))
         self.assertEqual(display.tool.children[0].c_size, (dp(20), dp(20)),
                          "Orthogonal chain graphics were not updated on circle size change")
@@ -581,8 +575,7 @@ class Test(unittest.TestCase):
         self.assertEqual(display.tool.children[0].l_color.rgb, [0.74, 0.42, 0.13],
                          "Inline chain graphics were not updated on line color setting change")
 
-        select_sidebar_button("Close Tool")
-        select_sidebar_button("Orthogonal Chain")
+        select_sidebar_buttons("Close Tool", "Orthogonal Chain")
         display.tool.on_touch_down(functions.Click(0.43 * x, 0.43 * y))
         self.assertEqual(display.tool.children[0].l_color.rgb, [0.74, 0.42, 0.13],
                          "Orthogonal chain graphics were not updated on line color size change")